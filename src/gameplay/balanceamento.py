@@ -0,0 +1,134 @@
+"""Estimador Monte Carlo de duelos entre o explorador e um goblin.
+
+Uso: ``python -m src.gameplay.balanceamento --forca 3:7 --defesa 0:4 --agilidade 1:4``.
+Cada combinação da grade substitui os atributos do lado escolhido em
+``--variar`` e relata a chance de vitória do explorador e a distribuição
+de ataques necessários para cada lado derrubar o outro.
+"""
+
+import argparse
+import itertools
+import time
+from typing import Any, Dict, List, Sequence
+
+from ..mundo.atributos import ATRIBUTOS_GOBLIN, ATRIBUTOS_JOGADOR
+from .combate_lote import PerfilCombate, dano_esperado, numpy_disponivel, resumir_turnos, simular_duelos
+
+PERFIL_JOGADOR = PerfilCombate(
+    vida=ATRIBUTOS_JOGADOR["vida_maxima"],
+    forca=ATRIBUTOS_JOGADOR["forca"],
+    defesa=ATRIBUTOS_JOGADOR["defesa"],
+    agilidade=ATRIBUTOS_JOGADOR["agilidade"],
+)
+PERFIL_GOBLIN = PerfilCombate(
+    vida=ATRIBUTOS_GOBLIN["vida_maxima"],
+    forca=ATRIBUTOS_GOBLIN["forca"],
+    defesa=ATRIBUTOS_GOBLIN["defesa"],
+    agilidade=ATRIBUTOS_GOBLIN["agilidade"],
+)
+
+
+def interpretar_intervalo(texto: str) -> List[int]:
+    """Converte ``"3"`` ou ``"3:7"`` (inclusivo) em uma lista de inteiros."""
+
+    partes = texto.split(":")
+    try:
+        if len(partes) == 1:
+            return [int(partes[0])]
+        if len(partes) == 2:
+            inicio, fim = int(partes[0]), int(partes[1])
+            return list(range(inicio, fim + 1))
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"Intervalo inválido: {texto!r} (use N ou INICIO:FIM).")
+
+
+def estimar_grade(
+    forcas: Sequence[int],
+    defesas: Sequence[int],
+    agilidades: Sequence[int],
+    variar: str,
+    amostras: int,
+    semente: int,
+    usar_numpy: bool,
+) -> List[Dict[str, Any]]:
+    """Simula todos os pontos da grade e devolve uma linha de resultados por ponto."""
+
+    linhas: List[Dict[str, Any]] = []
+    for indice, (forca, defesa, agilidade) in enumerate(itertools.product(forcas, defesas, agilidades)):
+        jogador, goblin = PERFIL_JOGADOR, PERFIL_GOBLIN
+        if variar == "jogador":
+            jogador = PerfilCombate(jogador.vida, forca, defesa, agilidade)
+        else:
+            goblin = PerfilCombate(goblin.vida, forca, defesa, agilidade)
+
+        resultado = simular_duelos(jogador, goblin, amostras, semente=semente + indice, usar_numpy=usar_numpy)
+        linhas.append(
+            {
+                "forca": forca,
+                "defesa": defesa,
+                "agilidade": agilidade,
+                "vitoria": resultado.probabilidade_vitoria,
+                "dano_jogador": float(dano_esperado(jogador, goblin)),
+                "dano_goblin": float(dano_esperado(goblin, jogador)),
+                "matar": resumir_turnos(resultado.turnos_para_matar),
+                "morrer": resumir_turnos(resultado.turnos_para_morrer),
+            }
+        )
+    return linhas
+
+
+def imprimir_tabela(linhas: Sequence[Dict[str, Any]], variar: str) -> None:
+    """Mostra os resultados em colunas alinhadas."""
+
+    print(f"Atributos variados: {variar}")
+    print("FOR DEF AGI | vitória | dano @  g  | matar goblin: méd p50 p90 | cair: méd p50 p90")
+    for linha in linhas:
+        media_matar, p50_matar, p90_matar = linha["matar"]
+        media_morrer, p50_morrer, p90_morrer = linha["morrer"]
+        print(
+            f"{linha['forca']:>3} {linha['defesa']:>3} {linha['agilidade']:>3} | "
+            f"{linha['vitoria']:>7.1%} | "
+            f"{linha['dano_jogador']:>6.2f} {linha['dano_goblin']:>4.2f} | "
+            f"{media_matar:>18.2f} {p50_matar:>3} {p90_matar:>3} | "
+            f"{media_morrer:>10.2f} {p50_morrer:>3} {p90_morrer:>3}"
+        )
+
+
+def main() -> None:
+    """Interpreta os argumentos, executa a grade e imprime o relatório."""
+
+    parser = argparse.ArgumentParser(description="Estima tempo para matar em duelos explorador x goblin.")
+    parser.add_argument("--forca", type=interpretar_intervalo, default=interpretar_intervalo("3:7"))
+    parser.add_argument("--defesa", type=interpretar_intervalo, default=interpretar_intervalo("0:4"))
+    parser.add_argument("--agilidade", type=interpretar_intervalo, default=interpretar_intervalo("1:4"))
+    parser.add_argument(
+        "--variar",
+        choices=("jogador", "goblin"),
+        default="jogador",
+        help="lado cujos atributos percorrem a grade (o outro mantém os valores do jogo)",
+    )
+    parser.add_argument("--amostras", type=int, default=20000, help="duelos simulados por ponto da grade")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--sem-numpy", action="store_true", help="força o caminho da biblioteca padrão")
+    argumentos = parser.parse_args()
+
+    usar_numpy = numpy_disponivel() and not argumentos.sem_numpy
+    inicio = time.perf_counter()
+    linhas = estimar_grade(
+        argumentos.forca,
+        argumentos.defesa,
+        argumentos.agilidade,
+        argumentos.variar,
+        argumentos.amostras,
+        argumentos.semente,
+        usar_numpy,
+    )
+    duracao = time.perf_counter() - inicio
+    imprimir_tabela(linhas, argumentos.variar)
+    motor = "NumPy" if usar_numpy else "biblioteca padrão"
+    print(f"\n{len(linhas)} pontos x {argumentos.amostras} duelos em {duracao:.2f}s ({motor}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Resolução de combate em lote para estudos de balanceamento.
+
+Reproduz as regras de `combate.calcular_dano` sem mensagens nem alteração
+de entidades, processando muitos ataques ou duelos de uma só vez. Quando o
+NumPy está instalado os sorteios são vetorizados; caso contrário, a
+biblioteca padrão é usada com a mesma interface.
+"""
+
+import random
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, List, Optional, Sequence, Tuple
+
+from ..mundo.entidade import Entidade
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+
+@dataclass(frozen=True)
+class PerfilCombate:
+    """Atributos de uma entidade relevantes para o combate."""
+
+    vida: int
+    forca: int
+    defesa: int
+    agilidade: int
+
+    @classmethod
+    def de_entidade(cls, entidade: Entidade) -> "PerfilCombate":
+        """Extrai o perfil de combate a partir de uma entidade existente."""
+        return cls(
+            vida=entidade.vida_maxima,
+            forca=entidade.forca,
+            defesa=entidade.defesa,
+            agilidade=entidade.agilidade,
+        )
+
+
+@dataclass
+class ResultadoDuelos:
+    """Resumo de um lote de duelos simulados."""
+
+    quantidade: int
+    vitorias_atacante: int
+    turnos_para_matar: Sequence[int]
+    turnos_para_morrer: Sequence[int]
+
+    @property
+    def probabilidade_vitoria(self) -> float:
+        """Fração dos duelos vencidos por quem ataca primeiro."""
+        return self.vitorias_atacante / self.quantidade if self.quantidade else 0.0
+
+
+def numpy_disponivel() -> bool:
+    """Indica se o caminho vetorizado com NumPy pode ser usado."""
+    return np is not None
+
+
+def _usar_numpy(usar_numpy: Optional[bool]) -> bool:
+    """Resolve a preferência do chamador considerando o ambiente."""
+    if usar_numpy is None:
+        return np is not None
+    if usar_numpy and np is None:
+        raise RuntimeError("NumPy não está instalado; use usar_numpy=False.")
+    return usar_numpy
+
+
+def _novo_gerador(semente: Optional[int], usar_numpy: bool) -> Any:
+    """Cria o gerador pseudoaleatório adequado ao caminho escolhido."""
+    if usar_numpy:
+        return np.random.default_rng(semente)
+    return random.Random(semente)
+
+
+def danos_possiveis(atacante: PerfilCombate, defensor: PerfilCombate) -> List[int]:
+    """Lista os danos equiprováveis de um ataque, um por valor de variação."""
+    variacao_maxima = max(1, atacante.agilidade)
+    return [max(1, atacante.forca + variacao - defensor.defesa) for variacao in range(variacao_maxima + 1)]
+
+
+def dano_esperado(atacante: PerfilCombate, defensor: PerfilCombate) -> Fraction:
+    """Calcula o valor esperado exato do dano de um único ataque."""
+    danos = danos_possiveis(atacante, defensor)
+    return Fraction(sum(danos), len(danos))
+
+
+def calcular_danos_lote(
+    forcas: Sequence[int],
+    agilidades: Sequence[int],
+    defesas: Sequence[int],
+    semente: Optional[int] = None,
+    usar_numpy: Optional[bool] = None,
+) -> Sequence[int]:
+    """Resolve vários ataques de uma vez, um por posição dos vetores.
+
+    Equivale a chamar `combate.calcular_dano` para cada trio
+    (força do atacante, agilidade do atacante, defesa do defensor).
+    """
+
+    if not len(forcas) == len(agilidades) == len(defesas):
+        raise ValueError("Os vetores de atributos precisam ter o mesmo tamanho.")
+
+    vetorizado = _usar_numpy(usar_numpy)
+    gerador = _novo_gerador(semente, vetorizado)
+    if vetorizado:
+        forcas_np = np.asarray(forcas, dtype=np.int64)
+        limites = np.maximum(1, np.asarray(agilidades, dtype=np.int64)) + 1
+        variacoes = gerador.integers(0, limites)
+        return np.maximum(1, forcas_np + variacoes - np.asarray(defesas, dtype=np.int64))
+
+    return [
+        max(1, forca + gerador.randint(0, max(1, agilidade)) - defesa)
+        for forca, agilidade, defesa in zip(forcas, agilidades, defesas)
+    ]
+
+
+def amostrar_turnos_para_matar(
+    atacante: PerfilCombate,
+    defensor: PerfilCombate,
+    quantidade: int,
+    semente: Optional[int] = None,
+    usar_numpy: Optional[bool] = None,
+    gerador: Any = None,
+) -> Sequence[int]:
+    """Sorteia quantos ataques o atacante precisa para derrubar o defensor."""
+
+    vetorizado = _usar_numpy(usar_numpy)
+    if gerador is None:
+        gerador = _novo_gerador(semente, vetorizado)
+    danos = danos_possiveis(atacante, defensor)
+    # Como o dano mínimo é positivo, nenhum duelo dura mais que este limite.
+    limite_ataques = -(-defensor.vida // min(danos))
+
+    if vetorizado:
+        sorteios = gerador.integers(0, len(danos), size=(quantidade, limite_ataques))
+        acumulado = np.cumsum(np.asarray(danos, dtype=np.int64)[sorteios], axis=1)
+        return np.argmax(acumulado >= defensor.vida, axis=1) + 1
+
+    turnos: List[int] = []
+    for _ in range(quantidade):
+        vida = defensor.vida
+        ataques = 0
+        for dano in gerador.choices(danos, k=limite_ataques):
+            vida -= dano
+            ataques += 1
+            if vida <= 0:
+                break
+        turnos.append(ataques)
+    return turnos
+
+
+def simular_duelos(
+    atacante: PerfilCombate,
+    defensor: PerfilCombate,
+    quantidade: int,
+    semente: Optional[int] = None,
+    usar_numpy: Optional[bool] = None,
+) -> ResultadoDuelos:
+    """Simula duelos em que o atacante golpeia primeiro e os dois se alternam.
+
+    O atacante vence quando precisa de no máximo tantos golpes quanto o
+    defensor, já que sempre age antes dele a cada rodada.
+    """
+
+    vetorizado = _usar_numpy(usar_numpy)
+    gerador = _novo_gerador(semente, vetorizado)
+    para_matar = amostrar_turnos_para_matar(atacante, defensor, quantidade, usar_numpy=vetorizado, gerador=gerador)
+    para_morrer = amostrar_turnos_para_matar(defensor, atacante, quantidade, usar_numpy=vetorizado, gerador=gerador)
+
+    if vetorizado:
+        vitorias = int(np.count_nonzero(para_matar <= para_morrer))
+    else:
+        vitorias = sum(1 for matar, morrer in zip(para_matar, para_morrer) if matar <= morrer)
+    return ResultadoDuelos(
+        quantidade=quantidade,
+        vitorias_atacante=vitorias,
+        turnos_para_matar=para_matar,
+        turnos_para_morrer=para_morrer,
+    )
+
+
+def resumir_turnos(turnos: Sequence[int]) -> Tuple[float, int, int]:
+    """Retorna média, mediana e percentil 90 de uma amostra de turnos."""
+
+    if not len(turnos):
+        raise ValueError("A amostra de turnos está vazia.")
+    if np is not None and isinstance(turnos, np.ndarray):
+        ordenados: Any = np.sort(turnos)
+        media = float(ordenados.mean())
+    else:
+        ordenados = sorted(turnos)
+        media = sum(ordenados) / len(ordenados)
+    total = len(ordenados)
+    return media, int(ordenados[total // 2]), int(ordenados[(total * 9) // 10])
@@ -1,24 +1,44 @@
 """Ponto de entrada do roguelike ASCII."""
 
-import random
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from __future__ import annotations
 
-from .entrada import ler_comando
-from .gameplay.combate import resolver_ataque
-from .mundo.entidade import Entidade
-from .mundo.gerador_mapa import Mapa, gerar_mapa_salas, listar_posicoes_caminhaveis
-from .mundo.sistema_turnos import SistemaTurnos
-from .render import mostrar_resumo_final, renderizar
-from .util.fov import atualizar_celulas_reveladas, calcular_fov
+import time
+
+# Marcado antes dos demais imports para que `--timing` inclua o custo deles.
+_INICIO_IMPORTACAO = time.perf_counter()
+
+import argparse  # noqa: E402
+import random  # noqa: E402
+import sys  # noqa: E402
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple  # noqa: E402
+
+from .entrada import ler_comando  # noqa: E402
+from .gameplay.combate import resolver_ataque  # noqa: E402
+from .mundo.atributos import ATRIBUTOS_GOBLIN, ATRIBUTOS_JOGADOR  # noqa: E402
+from .mundo.entidade import Entidade  # noqa: E402
+from .mundo.gerador_mapa import Mapa, gerar_mapa_salas, listar_posicoes_caminhaveis  # noqa: E402
+from .mundo.sistema_turnos import SistemaTurnos  # noqa: E402
+from .render import mostrar_resumo_final, renderizar  # noqa: E402
+from .util.cronometro import Cronometro  # noqa: E402
+from .util.fov import CacheFov, atualizar_celulas_reveladas, calcular_fov  # noqa: E402
+from .util.linha_de_visao import ServicoLinhaDeVisao  # noqa: E402
+
+_DURACAO_IMPORTACAO = time.perf_counter() - _INICIO_IMPORTACAO
+
+if TYPE_CHECKING:
+    # O servidor de espectadores carrega `asyncio`; só é importado quando usado.
+    from .rede.servidor import ServidorEspectadores
 
 LARGURA_MAPA = 100
 ALTURA_MAPA = 60
 QUANTIDADE_SALAS = 18
 RAIO_FOV = 12
+RAIO_PERCEPCAO_GOBLIN = 10
 QUANTIDADE_GOBLINS = 8
+ORCAMENTO_PRIMEIRO_QUADRO_MS = 250
 
 
-def preparar_jogo() -> Tuple[
+def preparar_jogo(cronometro: Optional[Cronometro] = None) -> Tuple[
     Entidade, 
     List[Entidade], 
     Mapa, 
@@ -29,30 +49,33 @@ def preparar_jogo() -> Tuple[
 ]:
     """Configura o mapa, jogador, goblins e estruturas auxiliares."""
 
-    mapa, (inicio_x, inicio_y) = gerar_mapa_salas(LARGURA_MAPA, ALTURA_MAPA, QUANTIDADE_SALAS)
+    if cronometro is None:
+        cronometro = Cronometro()
+    with cronometro.medir("gerar_mapa_salas"):
+        mapa, (inicio_x, inicio_y) = gerar_mapa_salas(LARGURA_MAPA, ALTURA_MAPA, QUANTIDADE_SALAS)
     jogador = Entidade(
         x=inicio_x,
         y=inicio_y,
         simbolo="@",
         nome="Explorador",
-        vida_maxima=18,
-        vida_atual=18,
-        energia_maxima=6,
-        energia_atual=6,
-        nivel=1,
-        forca=5,
-        defesa=2,
-        agilidade=2,
+        **ATRIBUTOS_JOGADOR,
     )
 
     entidades: List [Entidade] = [jogador]
-    posicoes_livres = listar_posicoes_caminhaveis(mapa)
-    goblins = _criar_goblins(posicoes_livres, jogador)
-    entidades.extend(goblins)
-
-    sistema_turnos = SistemaTurnos()
-    mensagens: List[str] = ["Você desperta em um lugar desconhecido.", "Passos apressados ecoam nas sombras..."]
-    reveladas = [[False for _ in range(mapa.largura)] for _ in range(mapa.altura)]
+    with cronometro.medir("listar_posicoes_caminhaveis"):
+        posicoes_livres = listar_posicoes_caminhaveis(mapa)
+    with cronometro.medir("spawn de goblins"):
+        goblins = _criar_goblins(posicoes_livres, jogador)
+        entidades.extend(goblins)
+
+    with cronometro.medir("estruturas auxiliares"):
+        sistema_turnos = SistemaTurnos(
+            linha_de_visao=ServicoLinhaDeVisao(mapa),
+            raio_percepcao=RAIO_PERCEPCAO_GOBLIN,
+        )
+        sistema_turnos.acompanhar(entidades)
+        mensagens: List[str] = ["Você desperta em um lugar desconhecido.", "Passos apressados ecoam nas sombras..."]
+        reveladas = [[False for _ in range(mapa.largura)] for _ in range(mapa.altura)]
     estatisticas = {"inimigos_derrotados": 0, "pocoes_coletadas": 0}
     return jogador, entidades, mapa, sistema_turnos, mensagens, reveladas, estatisticas
 
@@ -74,15 +97,8 @@ def _criar_goblins(posicoes_livres: Sequence[Tuple[int, int]], jogador: Entidade
                 y=y,
                 simbolo="g",
                 nome="Goblin",
-                vida_maxima=8,
-                vida_atual=8,
-                energia_maxima=4,
-                energia_atual=4,
-                nivel=1,
-                forca=4,
-                defesa=1,
-                agilidade=3,
                 hostil=True,
+                **ATRIBUTOS_GOBLIN,
             )
         )
     return goblins
@@ -167,16 +183,27 @@ def atualizar_visibilidade(
     mapa: Mapa,
     jogador: Entidade,
     reveladas: List[List[bool]],
+    cache: Optional[CacheFov] = None,
 ) -> Tuple[Set[Tuple[int, int]], List[List[bool]]]:
     """Calcula as células visíveis e atualiza as reveladas."""
 
-    visiveis = calcular_fov(mapa, (jogador.x, jogador.y), RAIO_FOV)
+    if cache is not None:
+        visiveis = cache.calcular(mapa, (jogador.x, jogador.y), RAIO_FOV)
+    else:
+        visiveis = calcular_fov(mapa, (jogador.x, jogador.y), RAIO_FOV)
     atualizar_celulas_reveladas(reveladas, visiveis)
     return visiveis, reveladas
 
 
-def executar_jogo() -> None:
-    """Laço principal responsável por rodar o jogo."""
+def executar_jogo(
+    servidor: Optional[ServidorEspectadores] = None,
+    cronometro: Optional[Cronometro] = None,
+) -> None:
+    """Laço principal responsável por rodar o jogo.
+
+    Com um cronômetro, o tempo até o primeiro quadro é registrado e o
+    relatório de inicialização é exibido ao final da partida.
+    """
 
     (
         jogador,
@@ -186,12 +213,15 @@ def executar_jogo() -> None:
         mensagens,
         reveladas,
         estatisticas,
-    )= preparar_jogo()
+    )= preparar_jogo(cronometro)
     rodando = True
     jogador_vivo = True
+    primeiro_quadro = cronometro is not None
+    cache_fov = CacheFov()
 
     while rodando and jogador_vivo:
-        visiveis, reveladas = atualizar_visibilidade(mapa, jogador, reveladas)
+        inicio_quadro = time.perf_counter()
+        visiveis, reveladas = atualizar_visibilidade(mapa, jogador, reveladas, cache_fov)
         renderizar(
             mapa,
             entidades,
@@ -201,6 +231,20 @@ def executar_jogo() -> None:
             jogador,
             sistema_turnos.turno_atual,
         )
+        if primeiro_quadro and cronometro is not None:
+            cronometro.registrar("primeiro quadro", time.perf_counter() - inicio_quadro)
+            cronometro.encerrar()
+            primeiro_quadro = False
+        if servidor is not None:
+            servidor.publicar(
+                mapa,
+                entidades,
+                visiveis,
+                reveladas,
+                mensagens,
+                jogador,
+                sistema_turnos.turno_atual,
+            )
         comando = aguardar_comando()
         rodando = processar_comando(jogador, entidades, mapa, comando, mensagens, estatisticas)
         if rodando:
@@ -210,13 +254,125 @@ def executar_jogo() -> None:
                 jogador_vivo = False
                 break
 
+    if servidor is not None:
+        visiveis, reveladas = atualizar_visibilidade(mapa, jogador, reveladas, cache_fov)
+        servidor.publicar(
+            mapa,
+            entidades,
+            visiveis,
+            reveladas,
+            mensagens,
+            jogador,
+            sistema_turnos.turno_atual,
+        )
     mostrar_resumo_final(jogador, sistema_turnos.turno_atual, estatisticas, mensagens)
+    if cronometro is not None:
+        _imprimir_tempos(cronometro)
+
+
+def medir_primeiro_quadro(
+    orcamento_ms: float = ORCAMENTO_PRIMEIRO_QUADRO_MS,
+    duracao_argumentos: float = 0.0,
+) -> bool:
+    """Prepara o jogo, desenha um único quadro e compara o tempo ao orçamento.
+
+    Serve como verificação de regressão do tempo de inicialização: não lê
+    entrada e retorna se o tempo desde os imports ficou dentro do orçamento.
+    """
+
+    cronometro = _novo_cronometro(duracao_argumentos)
+    jogador, entidades, mapa, sistema_turnos, mensagens, reveladas, _ = preparar_jogo(cronometro)
+    with cronometro.medir("primeiro quadro"):
+        visiveis, reveladas = atualizar_visibilidade(mapa, jogador, reveladas)
+        renderizar(mapa, entidades, visiveis, reveladas, mensagens, jogador, sistema_turnos.turno_atual)
+    cronometro.encerrar()
+
+    total_ms = cronometro.decorrido() * 1000
+    _imprimir_tempos(cronometro)
+    dentro_do_orcamento = total_ms <= orcamento_ms
+    situacao = "dentro do" if dentro_do_orcamento else "ACIMA do"
+    print(f"Primeiro quadro em {total_ms:.2f} ms, {situacao} orçamento de {orcamento_ms:.0f} ms.")
+    return dentro_do_orcamento
+
+
+def _novo_cronometro(duracao_argumentos: float = 0.0) -> Cronometro:
+    """Cria um cronômetro contado a partir dos imports deste módulo."""
+
+    cronometro = Cronometro(inicio=_INICIO_IMPORTACAO)
+    cronometro.registrar("imports", _DURACAO_IMPORTACAO)
+    if duracao_argumentos:
+        cronometro.registrar("argumentos", duracao_argumentos)
+    return cronometro
+
+
+def _iniciar_servidor(host: str, porta: int) -> ServidorEspectadores:
+    """Importa o servidor de espectadores sob demanda e o coloca no ar."""
+
+    from .rede.servidor import ServidorEspectadores
+
+    servidor = ServidorEspectadores(host, porta)
+    servidor.iniciar_em_segundo_plano()
+    return servidor
+
+
+def _imprimir_tempos(cronometro: Cronometro) -> None:
+    """Exibe o relatório de fases da inicialização."""
+
+    print("Tempos de inicialização:")
+    for linha in cronometro.relatorio():
+        print(f"  {linha}")
 
 
 def main() -> None:
     """Inicializa e executa o jogo."""
-    
-    executar_jogo()
+
+    inicio_argumentos = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Roguelike ASCII em terminal.")
+    parser.add_argument(
+        "--espectadores",
+        type=int,
+        metavar="PORTA",
+        help="transmite a partida para espectadores conectados nesta porta TCP",
+    )
+    parser.add_argument(
+        "--host-espectadores",
+        default="127.0.0.1",
+        metavar="HOST",
+        help="endereço de escuta dos espectadores (use 0.0.0.0 para a rede local)",
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="mede imports e fases de preparação e exibe o relatório ao final",
+    )
+    parser.add_argument(
+        "--verificar-inicializacao",
+        nargs="?",
+        type=float,
+        const=ORCAMENTO_PRIMEIRO_QUADRO_MS,
+        metavar="MS",
+        help="desenha apenas o primeiro quadro e falha se ultrapassar o orçamento (padrão: %(const)s ms)",
+    )
+    argumentos = parser.parse_args()
+    duracao_argumentos = time.perf_counter() - inicio_argumentos
+
+    if argumentos.verificar_inicializacao is not None:
+        dentro_do_orcamento = medir_primeiro_quadro(argumentos.verificar_inicializacao, duracao_argumentos)
+        sys.exit(0 if dentro_do_orcamento else 1)
+
+    cronometro = _novo_cronometro(duracao_argumentos) if argumentos.timing else None
+    servidor: Optional[ServidorEspectadores] = None
+    if argumentos.espectadores is not None:
+        if cronometro is not None:
+            with cronometro.medir("servidor de espectadores"):
+                servidor = _iniciar_servidor(argumentos.host_espectadores, argumentos.espectadores)
+        else:
+            servidor = _iniciar_servidor(argumentos.host_espectadores, argumentos.espectadores)
+    try:
+        executar_jogo(servidor, cronometro)
+    finally:
+        if servidor is not None:
+            servidor.parar()
 
 
 if __name__ == "__main__":
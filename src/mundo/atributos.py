@@ -0,0 +1,26 @@
+"""Atributos iniciais do explorador e dos inimigos.
+
+Mantidos fora de `main` para que ferramentas como o estimador de
+balanceamento usem os mesmos valores sem carregar o jogo inteiro.
+"""
+
+ATRIBUTOS_JOGADOR = {
+    "vida_maxima": 18,
+    "vida_atual": 18,
+    "energia_maxima": 6,
+    "energia_atual": 6,
+    "nivel": 1,
+    "forca": 5,
+    "defesa": 2,
+    "agilidade": 2,
+}
+ATRIBUTOS_GOBLIN = {
+    "vida_maxima": 8,
+    "vida_atual": 8,
+    "energia_maxima": 4,
+    "energia_atual": 4,
+    "nivel": 1,
+    "forca": 4,
+    "defesa": 1,
+    "agilidade": 3,
+}
@@ -0,0 +1,40 @@
+"""Diário dos movimentos de entidades ocorridos em cada turno."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from .entidade import Entidade
+
+Coordenada = Tuple[int, int]
+
+
+@dataclass(frozen=True, eq=False)
+class Movimento:
+    """Deslocamento de uma entidade entre duas posições.
+
+    Comparado por identidade, pois `Entidade` não é hashável.
+    """
+
+    entidade: "Entidade"
+    origem: Coordenada
+    destino: Coordenada
+
+
+@dataclass
+class DiarioMovimentos:
+    """Acumula os movimentos do turno corrente até que ele seja encerrado."""
+
+    movimentos: List[Movimento] = field(default_factory=list)
+
+    def registrar(self, entidade: Entidade, origem: Coordenada, destino: Coordenada) -> None:
+        """Anota um movimento no turno corrente."""
+        self.movimentos.append(Movimento(entidade, origem, destino))
+
+    def encerrar_turno(self) -> List[Movimento]:
+        """Retorna os movimentos acumulados e começa um turno vazio."""
+        movimentos = self.movimentos
+        self.movimentos = []
+        return movimentos
@@ -1,7 +1,9 @@
 """Módulo que define as entidades básicas do jogo."""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
+
+from .diario import DiarioMovimentos
 
 
 @dataclass
@@ -22,11 +24,15 @@ class Entidade:
     agilidade: int = 1
     hostil: bool = False
     inventario: List[str] = field(default_factory=list)
+    diario: Optional[DiarioMovimentos] = field(default=None, repr=False, compare=False)
 
     def mover(self, delta_x: int, delta_y: int) -> None:
         """Atualiza a posição da entidade somando os deltas informados."""
+        origem = (self.x, self.y)
         self.x += delta_x
         self.y += delta_y
+        if self.diario is not None:
+            self.diario.registrar(self, origem, (self.x, self.y))
 
     def descricao_vida(self) -> str:
         """Retorna uma descrição curta dos pontos de vida atuais da entidade."""
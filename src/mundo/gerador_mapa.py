@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 PAREDE = "#"
 CHAO = "."
@@ -33,15 +33,36 @@ class Mapa:
     largura: int
     altura: int
     grade: List[List[str]] = field(init=False)
+    versao: int = field(default=0, init=False)
+    versao_linhas: List[int] = field(init=False)
 
     def __post_init__(self) -> None:
         """Inicializa a grade cheia de paredes."""
         self.grade = [[PAREDE for _ in range(self.largura)] for _ in range(self.altura)]
+        self.versao_linhas = [0 for _ in range(self.altura)]
 
     def esculpir(self, x: int, y: int) -> None:
         """Transforma a posição informada em chão caminhável."""
-        if 0 <= x < self.largura and 0 <= y < self.altura:
+        if 0 <= x < self.largura and 0 <= y < self.altura and self.grade[y][x] != CHAO:
             self.grade[y][x] = CHAO
+            self._marcar_alteracao(y)
+
+    def _marcar_alteracao(self, y: int) -> None:
+        """Avança a versão do mapa e marca a linha alterada com ela."""
+        self.versao += 1
+        self.versao_linhas[y] = self.versao
+
+    def linhas_alteradas_desde(self, versao: int, inicio: int = 0, fim: Optional[int] = None) -> List[int]:
+        """Lista as linhas no intervalo ``[inicio, fim)`` alteradas após a versão informada.
+
+        Cada consumidor guarda a última versão que processou, então vários
+        caches podem acompanhar as mesmas alterações de forma independente.
+        """
+        if versao >= self.versao:
+            return []
+        inicio = max(0, inicio)
+        fim = self.altura if fim is None else min(self.altura, fim)
+        return [y for y in range(inicio, fim) if self.versao_linhas[y] > versao]
 
     def eh_parede(self, x: int, y: int) -> bool:
         """Retorna se a célula é uma parede sólida."""
@@ -132,9 +153,9 @@ def _salas_se_intersectam(sala_a: Sala, sala_b: Sala) -> bool:
 def listar_posicoes_caminhaveis(mapa: Mapa) -> List[Tuple[int, int]]:
     """Retorna todas as posições marcadas como chão no mapa."""
 
-    posicoes: List[Tuple[int, int]] = []
-    for y in range(mapa.altura):
-        for x in range(mapa.largura):
-            if not mapa.eh_parede(x, y):
-                posicoes.append((x, y))
-    return posicoes
\ No newline at end of file
+    return [
+        (x, y)
+        for y, linha in enumerate(mapa.grade)
+        for x, celula in enumerate(linha)
+        if celula != PAREDE
+    ]
\ No newline at end of file
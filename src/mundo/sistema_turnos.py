@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from ..gameplay.combate import resolver_ataque
+from ..util.linha_de_visao import ServicoLinhaDeVisao
+from .diario import DiarioMovimentos, Movimento
 from .entidade import Entidade
 from .gerador_mapa import Mapa
 
@@ -14,11 +16,20 @@ class SistemaTurnos:
 
     turno_atual: int = 1
     historico_turnos: List[str] = field(default_factory=list)
+    linha_de_visao: Optional[ServicoLinhaDeVisao] = None
+    raio_percepcao: int = 10
+    diario: DiarioMovimentos = field(default_factory=DiarioMovimentos)
+    ultimos_movimentos: List[Movimento] = field(default_factory=list)
 
     def registrar_evento(self, mensagem: str) -> None:
         """Armazena um texto descritivo do turno atual."""
         self.historico_turnos.append(mensagem)
 
+    def acompanhar(self, entidades: List[Entidade]) -> None:
+        """Liga as entidades ao diário para que seus movimentos sejam anotados."""
+        for entidade in entidades:
+            entidade.diario = self.diario
+
     def avancar(
         self,
         entidades: List[Entidade],
@@ -26,7 +37,11 @@ class SistemaTurnos:
         mapa: Mapa,
         mensagens: List[str],
     ) -> None:
-        """Avança o contador de turnos e executa ações das entidades hostis."""
+        """Avança o contador de turnos e executa ações das entidades hostis.
+
+        Ao final, os movimentos anotados desde o turno anterior (incluindo o
+        do jogador) ficam disponíveis em `ultimos_movimentos`.
+        """
 
         self.turno_atual += 1
         for entidade in list(entidades):
@@ -44,6 +59,11 @@ class SistemaTurnos:
                 resolver_ataque(entidade, jogador, mensagens)
                 continue
 
+            if self.linha_de_visao is not None and not self.linha_de_visao.pode_ver(
+                (entidade.x, entidade.y), (jogador.x, jogador.y), self.raio_percepcao
+            ):
+                continue
+
             candidato_x = entidade.x + passo_x
             candidato_y = entidade.y + passo_y
 
@@ -54,6 +74,8 @@ class SistemaTurnos:
             if ocupante is None:
                 entidade.mover(passo_x, passo_y)
 
+        self.ultimos_movimentos = self.diario.encerrar_turno()
+
 
 def _encontrar_primeiro_vivo(
     entidades: List[Entidade], x: int, y: int, ignorar: Optional[Entidade] = None
@@ -0,0 +1 @@
+"""Transmissão do estado do jogo para espectadores na rede local."""
@@ -0,0 +1,65 @@
+"""Cliente de terminal para assistir a uma partida transmitida na rede.
+
+Uso: ``python -m src.rede.espectador HOST PORTA``.
+"""
+
+import argparse
+import asyncio
+
+from ..render import limpar_tela
+from .protocolo import QUADRO_CHAVE, EstadoEspectador, desserializar_quadro
+
+
+def desenhar(estado: EstadoEspectador) -> None:
+    """Mostra a grade reconstruída e as mensagens mais recentes."""
+
+    limpar_tela()
+    for linha in estado.compor_linhas():
+        print(linha)
+    print("-" * max((len(linha) for linha in estado.linhas), default=0))
+    print(f"Turno: {estado.turno}  HP do explorador: {estado.vida}")
+    print("Mensagens:")
+    for mensagem in estado.mensagens[-6:]:
+        print(f" - {mensagem}")
+    print("\nModo espectador. Pressione Ctrl+C para sair.")
+
+
+async def assistir(host: str, porta: int) -> None:
+    """Conecta ao servidor e redesenha a tela a cada quadro recebido."""
+
+    leitor, escritor = await asyncio.open_connection(host, porta, limit=2**20)
+    estado = EstadoEspectador()
+    sincronizado = True
+    try:
+        while True:
+            linha = await leitor.readline()
+            if not linha:
+                break
+            quadro = desserializar_quadro(linha)
+            if quadro is None:
+                continue
+            if not sincronizado and quadro.get("tipo") != QUADRO_CHAVE:
+                continue
+            sincronizado = estado.aplicar(quadro)
+            if sincronizado:
+                desenhar(estado)
+    finally:
+        escritor.close()
+    print("A transmissão foi encerrada.")
+
+
+def main() -> None:
+    """Interpreta os argumentos e inicia o cliente espectador."""
+
+    parser = argparse.ArgumentParser(description="Assiste a uma partida transmitida na rede local.")
+    parser.add_argument("host", help="endereço do servidor do jogo")
+    parser.add_argument("porta", type=int, help="porta informada ao iniciar o jogo com --espectadores")
+    argumentos = parser.parse_args()
+    try:
+        asyncio.run(assistir(argumentos.host, argumentos.porta))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Codificação de quadros-chave e deltas enviados aos espectadores.
+
+Cada quadro é um objeto JSON em uma única linha terminada por ``\\n``. O
+primeiro quadro recebido por um espectador é sempre um quadro-chave com a
+grade completa; os seguintes carregam apenas os trechos alterados.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..mundo.entidade import Entidade
+from ..mundo.gerador_mapa import Mapa
+from ..render import compor_grade
+
+Coordenada = Tuple[int, int]
+Quadro = Dict[str, Any]
+DadosEntidade = List[Any]
+
+QUADRO_CHAVE = "chave"
+QUADRO_DELTA = "delta"
+LIMITE_MENSAGENS = 32
+
+
+def serializar_quadro(quadro: Quadro) -> bytes:
+    """Converte o quadro em uma linha JSON compacta."""
+    return json.dumps(quadro, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def desserializar_quadro(linha: bytes) -> Optional[Quadro]:
+    """Interpreta uma linha recebida, ignorando conteúdo malformado."""
+
+    try:
+        quadro = json.loads(linha.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return quadro if isinstance(quadro, dict) else None
+
+
+def _trechos_alterados(anterior: str, atual: str) -> List[Tuple[int, str]]:
+    """Agrupa as colunas alteradas de uma linha em trechos contíguos."""
+
+    trechos: List[Tuple[int, str]] = []
+    inicio = -1
+    for x, (antigo, novo) in enumerate(zip(anterior, atual)):
+        if antigo != novo:
+            if inicio < 0:
+                inicio = x
+        elif inicio >= 0:
+            trechos.append((inicio, atual[inicio:x]))
+            inicio = -1
+    if inicio >= 0:
+        trechos.append((inicio, atual[inicio:]))
+    return trechos
+
+
+class CodificadorQuadros:
+    """Guarda o último estado transmitido e gera deltas turno a turno."""
+
+    def __init__(self) -> None:
+        self.sequencia = 0
+        self._linhas: List[str] = []
+        self._entidades: Dict[int, DadosEntidade] = {}
+        self._identificadores: Dict[int, Tuple[Entidade, int]] = {}
+        self._proximo_identificador = 1
+        self._mensagens: List[str] = []
+        self._total_mensagens = 0
+        self._turno = 0
+        self._vida = ""
+
+    def capturar(
+        self,
+        mapa: Mapa,
+        entidades: Sequence[Entidade],
+        visiveis: Set[Coordenada],
+        reveladas: Sequence[Sequence[bool]],
+        mensagens: Sequence[str],
+        jogador: Entidade,
+        turno: int,
+    ) -> Quadro:
+        """Registra o estado atual e retorna o delta em relação ao anterior."""
+
+        linhas = compor_grade(mapa, (), visiveis, reveladas)
+        entidades_visiveis = self._coletar_entidades(entidades, visiveis)
+        novas_mensagens = self._coletar_mensagens(mensagens)
+
+        self.sequencia += 1
+        delta: Quadro = {"tipo": QUADRO_DELTA, "seq": self.sequencia, "turno": turno}
+
+        if len(linhas) != len(self._linhas):
+            delta["celulas"] = [[0, y, linha] for y, linha in enumerate(linhas)]
+        else:
+            celulas = []
+            for y, (anterior, atual) in enumerate(zip(self._linhas, linhas)):
+                if anterior != atual:
+                    celulas.extend([x, y, trecho] for x, trecho in _trechos_alterados(anterior, atual))
+            if celulas:
+                delta["celulas"] = celulas
+
+        movidas = {
+            str(identificador): dados
+            for identificador, dados in entidades_visiveis.items()
+            if self._entidades.get(identificador) != dados
+        }
+        removidas = [identificador for identificador in self._entidades if identificador not in entidades_visiveis]
+        if movidas:
+            delta["entidades"] = movidas
+        if removidas:
+            delta["removidas"] = removidas
+        if novas_mensagens:
+            delta["mensagens"] = novas_mensagens
+
+        vida = jogador.descricao_vida()
+        if vida != self._vida:
+            delta["vida"] = vida
+
+        self._linhas = linhas
+        self._entidades = entidades_visiveis
+        self._turno = turno
+        self._vida = vida
+        return delta
+
+    def quadro_chave(self, limite_mensagens: int = 6) -> Quadro:
+        """Retorna o estado completo mais recente para novos espectadores."""
+
+        return {
+            "tipo": QUADRO_CHAVE,
+            "seq": self.sequencia,
+            "turno": self._turno,
+            "linhas": list(self._linhas),
+            "entidades": {str(identificador): dados for identificador, dados in self._entidades.items()},
+            "mensagens": self._mensagens[-limite_mensagens:],
+            "vida": self._vida,
+        }
+
+    def _coletar_entidades(
+        self, entidades: Sequence[Entidade], visiveis: Set[Coordenada]
+    ) -> Dict[int, DadosEntidade]:
+        """Atribui identificadores estáveis e filtra as entidades visíveis."""
+
+        identificadores: Dict[int, Tuple[Entidade, int]] = {}
+        visiveis_por_id: Dict[int, DadosEntidade] = {}
+        for entidade in entidades:
+            registro = self._identificadores.get(id(entidade))
+            if registro is None:
+                registro = (entidade, self._proximo_identificador)
+                self._proximo_identificador += 1
+            identificadores[id(entidade)] = registro
+            if (entidade.x, entidade.y) in visiveis and entidade.esta_vivo():
+                visiveis_por_id[registro[1]] = [entidade.x, entidade.y, entidade.simbolo]
+        # Manter a referência impede que o `id` seja reaproveitado por outro objeto.
+        self._identificadores = identificadores
+        return visiveis_por_id
+
+    def _coletar_mensagens(self, mensagens: Sequence[str]) -> List[str]:
+        """Retorna apenas as mensagens ainda não transmitidas."""
+
+        if len(mensagens) < self._total_mensagens:
+            self._total_mensagens = 0
+        novas = list(mensagens[self._total_mensagens:])
+        self._total_mensagens = len(mensagens)
+        self._mensagens = (self._mensagens + novas)[-LIMITE_MENSAGENS:]
+        return novas
+
+
+class EstadoEspectador:
+    """Reconstrói o estado do jogo aplicando os quadros recebidos."""
+
+    def __init__(self) -> None:
+        self.sequencia = 0
+        self.turno = 0
+        self.linhas: List[List[str]] = []
+        self.entidades: Dict[str, DadosEntidade] = {}
+        self.mensagens: List[str] = []
+        self.vida = ""
+
+    def aplicar(self, quadro: Quadro) -> bool:
+        """Aplica um quadro; retorna ``False`` se um delta chegar fora de ordem."""
+
+        if quadro.get("tipo") == QUADRO_CHAVE:
+            self.linhas = [list(linha) for linha in quadro["linhas"]]
+            self.entidades = dict(quadro["entidades"])
+            self.mensagens = list(quadro["mensagens"])
+        else:
+            if quadro["seq"] != self.sequencia + 1:
+                return False
+            for x, y, trecho in quadro.get("celulas", ()):
+                if y >= len(self.linhas):
+                    self.linhas.extend([] for _ in range(y + 1 - len(self.linhas)))
+                linha = self.linhas[y]
+                if len(linha) < x + len(trecho):
+                    linha.extend(" " for _ in range(x + len(trecho) - len(linha)))
+                linha[x : x + len(trecho)] = trecho
+            self.entidades.update(quadro.get("entidades", {}))
+            for identificador in quadro.get("removidas", ()):
+                self.entidades.pop(str(identificador), None)
+            self.mensagens.extend(quadro.get("mensagens", ()))
+            del self.mensagens[:-LIMITE_MENSAGENS]
+        self.sequencia = quadro["seq"]
+        self.turno = quadro.get("turno", self.turno)
+        self.vida = quadro.get("vida", self.vida)
+        return True
+
+    def compor_linhas(self) -> List[str]:
+        """Sobrepõe as entidades à grade e devolve as linhas de texto."""
+
+        grade = [list(linha) for linha in self.linhas]
+        for x, y, simbolo in self.entidades.values():
+            if 0 <= y < len(grade) and 0 <= x < len(grade[y]):
+                grade[y][x] = simbolo
+        return ["".join(linha) for linha in grade]
+
@@ -0,0 +1,198 @@
+"""Servidor TCP que transmite a partida para vários espectadores.
+
+O jogo roda de forma síncrona no terminal, então o servidor mantém seu
+próprio laço `asyncio` em uma thread dedicada. Cada turno é codificado uma
+única vez e os mesmos bytes são repassados a todos os espectadores.
+"""
+
+import asyncio
+import threading
+from typing import Optional, Sequence, Set, Tuple
+
+from ..mundo.entidade import Entidade
+from ..mundo.gerador_mapa import Mapa
+from .protocolo import CodificadorQuadros, Quadro, serializar_quadro
+
+Coordenada = Tuple[int, int]
+
+
+class _Espectador:
+    """Fila de envio limitada associada a uma conexão."""
+
+    def __init__(self, escritor: asyncio.StreamWriter, limite_fila: int) -> None:
+        self.escritor = escritor
+        self.fila: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=limite_fila)
+
+
+class ServidorEspectadores:
+    """Aceita conexões e difunde quadros-chave e deltas em JSON por linha."""
+
+    def __init__(self, host: str = "127.0.0.1", porta: int = 0, limite_fila: int = 64) -> None:
+        self.host = host
+        self.porta = porta
+        self.limite_fila = limite_fila
+        self._codificador = CodificadorQuadros()
+        self._espectadores: Set[_Espectador] = set()
+        self._tarefas: Set["asyncio.Task[None]"] = set()
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._laco: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._chave_atual: Optional[Quadro] = None
+        self._chave_serializada: Optional[bytes] = None
+
+    @property
+    def endereco(self) -> Tuple[str, int]:
+        """Retorna o endereço efetivamente escutado pelo servidor."""
+        if self._servidor is None or not self._servidor.sockets:
+            return self.host, self.porta
+        host, porta = self._servidor.sockets[0].getsockname()[:2]
+        return host, porta
+
+    @property
+    def total_espectadores(self) -> int:
+        """Quantidade de conexões ativas no momento."""
+        return len(self._espectadores)
+
+    async def iniciar(self) -> None:
+        """Abre o socket de escuta no laço de eventos corrente."""
+        self._laco = asyncio.get_running_loop()
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+
+    async def encerrar(self, limite_segundos: float = 1.0) -> None:
+        """Fecha o socket de escuta e desconecta todos os espectadores.
+
+        Os espectadores são avisados antes de `wait_closed`, que a partir do
+        Python 3.12.1 espera todas as conexões abertas terminarem.
+        """
+        if self._servidor is not None:
+            self._servidor.close()
+        for espectador in list(self._espectadores):
+            self._enfileirar(espectador, None)
+
+        tarefas = list(self._tarefas)
+        if tarefas:
+            _, pendentes = await asyncio.wait(tarefas, timeout=limite_segundos)
+            # Conexões travadas em `drain` não recebem o aviso; são canceladas.
+            for tarefa in pendentes:
+                tarefa.cancel()
+            await asyncio.gather(*pendentes, return_exceptions=True)
+
+        if self._servidor is not None:
+            try:
+                await asyncio.wait_for(self._servidor.wait_closed(), timeout=limite_segundos)
+            except asyncio.TimeoutError:
+                pass
+
+    def iniciar_em_segundo_plano(self) -> None:
+        """Executa o servidor em uma thread própria até `parar` ser chamado."""
+
+        pronto = threading.Event()
+        falha: list = []
+
+        def executar() -> None:
+            laco = asyncio.new_event_loop()
+            asyncio.set_event_loop(laco)
+            try:
+                laco.run_until_complete(self.iniciar())
+            except OSError as erro:
+                falha.append(erro)
+                pronto.set()
+                laco.close()
+                return
+            pronto.set()
+            laco.run_forever()
+            laco.run_until_complete(self.encerrar())
+            laco.close()
+
+        self._thread = threading.Thread(target=executar, name="servidor-espectadores", daemon=True)
+        self._thread.start()
+        pronto.wait()
+        if falha:
+            raise falha[0]
+
+    def parar(self) -> None:
+        """Interrompe o servidor iniciado com `iniciar_em_segundo_plano`."""
+        if self._laco is not None and self._thread is not None:
+            self._laco.call_soon_threadsafe(self._laco.stop)
+            self._thread.join(timeout=2)
+
+    def publicar(
+        self,
+        mapa: Mapa,
+        entidades: Sequence[Entidade],
+        visiveis: Set[Coordenada],
+        reveladas: Sequence[Sequence[bool]],
+        mensagens: Sequence[str],
+        jogador: Entidade,
+        turno: int,
+    ) -> None:
+        """Codifica o turno atual e o envia a todos os espectadores.
+
+        Pode ser chamado a partir da thread do jogo: a codificação acontece
+        aqui e apenas o envio é agendado no laço do servidor.
+        """
+
+        delta = self._codificador.capturar(mapa, entidades, visiveis, reveladas, mensagens, jogador, turno)
+        chave = self._codificador.quadro_chave()
+        dados = serializar_quadro(delta)
+        if self._laco is None:
+            return
+        try:
+            self._laco.call_soon_threadsafe(self._difundir, chave, dados)
+        except RuntimeError:
+            # O laço já foi encerrado; não há mais ninguém para receber.
+            pass
+
+    def _difundir(self, chave: Quadro, dados: bytes) -> None:
+        """Atualiza o quadro-chave corrente e enfileira o delta para todos."""
+        self._chave_atual = chave
+        self._chave_serializada = None
+        for espectador in list(self._espectadores):
+            self._enfileirar(espectador, dados)
+
+    def _quadro_chave_serializado(self) -> Optional[bytes]:
+        """Serializa o quadro-chave sob demanda, apenas uma vez por turno."""
+        if self._chave_serializada is None and self._chave_atual is not None:
+            self._chave_serializada = serializar_quadro(self._chave_atual)
+        return self._chave_serializada
+
+    def _enfileirar(self, espectador: _Espectador, dados: Optional[bytes]) -> None:
+        """Enfileira dados; espectadores atrasados são ressincronizados."""
+        try:
+            espectador.fila.put_nowait(dados)
+            return
+        except asyncio.QueueFull:
+            pass
+        while not espectador.fila.empty():
+            espectador.fila.get_nowait()
+        espectador.fila.put_nowait(None if dados is None else self._quadro_chave_serializado())
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Envia o quadro-chave inicial e depois os deltas de cada turno."""
+
+        tarefa = asyncio.current_task()
+        if tarefa is not None:
+            self._tarefas.add(tarefa)
+        espectador = _Espectador(escritor, self.limite_fila)
+        chave = self._quadro_chave_serializado()
+        if chave is not None:
+            espectador.fila.put_nowait(chave)
+        self._espectadores.add(espectador)
+        try:
+            while True:
+                dados = await espectador.fila.get()
+                if dados is None:
+                    break
+                escritor.write(dados)
+                await escritor.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._espectadores.discard(espectador)
+            if tarefa is not None:
+                self._tarefas.discard(tarefa)
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except (ConnectionError, OSError):
+                pass
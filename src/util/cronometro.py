@@ -0,0 +1,44 @@
+"""Medição simples das fases de inicialização do jogo."""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+
+class Cronometro:
+    """Acumula a duração de fases nomeadas, na ordem em que ocorrem."""
+
+    def __init__(self, inicio: Optional[float] = None) -> None:
+        self.inicio = time.perf_counter() if inicio is None else inicio
+        self.fases: List[Tuple[str, float]] = []
+        self.fim: Optional[float] = None
+
+    @contextmanager
+    def medir(self, nome: str) -> Iterator[None]:
+        """Registra o tempo gasto dentro do bloco `with`."""
+        comeco = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(nome, time.perf_counter() - comeco)
+
+    def registrar(self, nome: str, segundos: float) -> None:
+        """Adiciona uma fase já medida externamente."""
+        self.fases.append((nome, segundos))
+
+    def encerrar(self) -> None:
+        """Congela o total para que o relatório ignore o tempo posterior."""
+        if self.fim is None:
+            self.fim = time.perf_counter()
+
+    def decorrido(self) -> float:
+        """Segundos desde o início até agora ou até `encerrar`."""
+        fim = time.perf_counter() if self.fim is None else self.fim
+        return fim - self.inicio
+
+    def relatorio(self) -> List[str]:
+        """Formata cada fase em milissegundos, seguida do total decorrido."""
+        largura = max((len(nome) for nome, _ in self.fases), default=0)
+        linhas = [f"{nome:<{largura}}  {segundos * 1000:8.2f} ms" for nome, segundos in self.fases]
+        linhas.append(f"{'total':<{largura}}  {self.decorrido() * 1000:8.2f} ms")
+        return linhas
@@ -1,10 +1,12 @@
 """Funções utilitárias relacionadas ao campo de visão."""
 
-from typing import Generator, Iterable, List, Set, Tuple
+from functools import lru_cache
+from typing import Dict, Generator, Iterable, List, Optional, Set, Tuple
 
 from ..mundo.gerador_mapa import Mapa
 
 Coordenada = Tuple[int, int]
+Trajeto = Tuple[Coordenada, ...]
 
 
 def _bresenham(x0: int, y0: int, x1: int, y1: int) -> Generator[Coordenada, None, None]:
@@ -29,25 +31,77 @@ def _bresenham(x0: int, y0: int, x1: int, y1: int) -> Generator[Coordenada, None
             y += sy
 
 
+@lru_cache(maxsize=None)
+def tabela_raios(raio: int) -> Dict[Coordenada, Trajeto]:
+    """Mapeia cada deslocamento dentro do círculo ao trajeto de Bresenham até ele.
+
+    O traçado depende apenas do deslocamento, então a tabela de cada raio é
+    calculada uma vez e vale para qualquer origem. Cada trajeto exclui a
+    origem e inclui o destino; a tabela é compartilhada e não deve ser alterada.
+    """
+    tabela: Dict[Coordenada, Trajeto] = {}
+    for dx in range(-raio, raio + 1):
+        for dy in range(-raio, raio + 1):
+            if dx * dx + dy * dy > raio * raio:
+                continue
+            tabela[(dx, dy)] = tuple(_bresenham(0, 0, dx, dy))[1:]
+    return tabela
+
+
 def calcular_fov(mapa: Mapa, origem: Coordenada, raio: int) -> Set[Coordenada]:
     """Retorna um conjunto de coordenadas visíveis a partir da origem."""
     visiveis: Set[Coordenada] = set()
     origem_x, origem_y = origem
+    if not _esta_dentro_do_mapa(mapa, origem_x, origem_y):
+        return visiveis
+    visiveis.add(origem)
 
-    for x in range(origem_x - raio, origem_x + raio + 1):
-        for y in range(origem_y - raio, origem_y + raio + 1):
-            if not _esta_dentro_do_mapa(mapa, x, y):
-                continue
-            if (x - origem_x) ** 2 + (y - origem_y) ** 2 > raio ** 2:
-                continue
-            for passo_x, passo_y in _bresenham(origem_x, origem_y, x, y):
-                visiveis.add((passo_x, passo_y))
-                if mapa.eh_parede(passo_x, passo_y) and (passo_x, passo_y) != (origem_x, origem_y):
-                    break
+    for (dx, dy), trajeto in tabela_raios(raio).items():
+        if not _esta_dentro_do_mapa(mapa, origem_x + dx, origem_y + dy):
+            continue
+        for passo_x, passo_y in trajeto:
+            celula = (origem_x + passo_x, origem_y + passo_y)
+            visiveis.add(celula)
+            if mapa.eh_parede(*celula):
+                break
 
     return visiveis
 
 
+class CacheFov:
+    """Reaproveita o último campo de visão enquanto nada relevante mudar.
+
+    O resultado é recalculado apenas se a origem ou o raio mudarem, ou se
+    alguma linha do mapa ao alcance do raio tiver sido alterada. O conjunto
+    devolvido é compartilhado entre chamadas e não deve ser modificado.
+    """
+
+    def __init__(self) -> None:
+        self._mapa: Optional[Mapa] = None
+        self._origem: Optional[Coordenada] = None
+        self._raio = -1
+        self._versao = -1
+        self._visiveis: Set[Coordenada] = set()
+
+    def calcular(self, mapa: Mapa, origem: Coordenada, raio: int) -> Set[Coordenada]:
+        """Retorna o FOV em cache ou o recalcula com `calcular_fov`."""
+        if (
+            mapa is self._mapa
+            and origem == self._origem
+            and raio == self._raio
+            and not mapa.linhas_alteradas_desde(self._versao, origem[1] - raio, origem[1] + raio + 1)
+        ):
+            self._versao = mapa.versao
+            return self._visiveis
+
+        self._visiveis = calcular_fov(mapa, origem, raio)
+        self._mapa = mapa
+        self._origem = origem
+        self._raio = raio
+        self._versao = mapa.versao
+        return self._visiveis
+
+
 def atualizar_celulas_reveladas(
     reveladas: List[List[bool]], visiveis: Iterable[Coordenada]
 ) -> None:
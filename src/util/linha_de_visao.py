@@ -0,0 +1,55 @@
+"""Serviço de linha de visão usado na percepção dos monstros."""
+
+from typing import Dict, Tuple
+
+from ..mundo.gerador_mapa import Mapa
+from .fov import Coordenada, Trajeto, tabela_raios
+
+
+class ServicoLinhaDeVisao:
+    """Responde se uma posição enxerga outra, guardando respostas por versão do mapa."""
+
+    def __init__(self, mapa: Mapa, limite_cache: int = 65536) -> None:
+        self.mapa = mapa
+        self.limite_cache = limite_cache
+        self._cache: Dict[Tuple[Coordenada, Coordenada], bool] = {}
+        self._versao_cache = mapa.versao
+
+    def pode_ver(self, origem: Coordenada, destino: Coordenada, raio: int) -> bool:
+        """Indica se há linha de visão entre os pontos, de forma simétrica.
+
+        A resposta é a mesma para ``(a, b)`` e ``(b, a)``: basta que o
+        traçado em um dos sentidos não atravesse paredes intermediárias.
+        """
+
+        dx = destino[0] - origem[0]
+        dy = destino[1] - origem[1]
+        if dx * dx + dy * dy > raio * raio:
+            return False
+        if dx == 0 and dy == 0:
+            return True
+
+        if self.mapa.versao != self._versao_cache or len(self._cache) >= self.limite_cache:
+            self._cache.clear()
+            self._versao_cache = self.mapa.versao
+
+        # O trajeto não depende do raio, que só limita a distância acima.
+        chave = (origem, destino) if origem <= destino else (destino, origem)
+        resultado = self._cache.get(chave)
+        if resultado is None:
+            tabela = tabela_raios(raio)
+            resultado = self._trajeto_livre(origem, tabela[(dx, dy)]) or self._trajeto_livre(
+                destino, tabela[(-dx, -dy)]
+            )
+            self._cache[chave] = resultado
+        return resultado
+
+    def _trajeto_livre(self, origem: Coordenada, trajeto: Trajeto) -> bool:
+        """Verifica se nenhuma célula antes do destino bloqueia a visão."""
+
+        origem_x, origem_y = origem
+        eh_parede = self.mapa.eh_parede
+        for passo_x, passo_y in trajeto[:-1]:
+            if eh_parede(origem_x + passo_x, origem_y + passo_y):
+                return False
+        return True